@@ -5,6 +5,7 @@ from MLOXMaker.managers.app_log import AppLog, LogGroup, LogEvent
 
 def main():
     """MLOXMaker entry point."""
+    Settings.ensure_dirs()
     AppLog.setup_logger()
     AppLog.info(LogGroup.SYSTEM, LogEvent.STARTED, "MLOXMaker is starting up.")
 
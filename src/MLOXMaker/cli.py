@@ -1,34 +1,40 @@
-import argparse
+import sys
 from MLOXMaker.managers.app_log import AppLog, LogGroup, LogEvent
-from MLOXMaker.database.manager import DatabaseManager
 
 
 def validate_rules():
     """Validates stored rules and prints results."""
-    rules = DatabaseManager.get_rules()
+    from MLOXMaker.database.manager import DatabaseManager  # Deferred: only DB commands pay for SQLAlchemy
+
+    rules = DatabaseManager.iter_rule_summaries()
     if not rules:
         print("No rules found.")
         return
 
     print(f"✅ {len(rules)} rules loaded.")
-    for rule in rules:
-        print(f"📌 {rule.rule_type}: {rule.mod_name} -> {rule.target_mod or 'N/A'}")
+    for rule_type, mod_name, target_mod in rules:
+        print(f"📌 {rule_type}: {mod_name} -> {target_mod or 'N/A'}")
 
 
 def list_mods():
     """Lists all mods stored in the database."""
-    mods = DatabaseManager.get_mods()
+    from MLOXMaker.database.manager import DatabaseManager  # Deferred: only DB commands pay for SQLAlchemy
+
+    mods = DatabaseManager.iter_mod_summaries()
     if not mods:
         print("No mods found.")
         return
 
     print(f"📦 {len(mods)} mods installed.")
-    for mod in mods:
-        print(f"📜 {mod.mod_name} (Source: {mod.source or 'Unknown'})")
+    for mod_name, source in mods:
+        print(f"📜 {mod_name} (Source: {source or 'Unknown'})")
 
 
-def cli_main():
-    """CLI Entry Point"""
+def _parse_with_argparse():
+    """Handles everything off the fast path (no command, --help, unknown commands, extra arguments) via argparse,
+    which is only imported when actually needed. Invalid input exits with status 2, as argparse always has."""
+    import argparse
+
     parser = argparse.ArgumentParser(prog="mloxmaker", description="MLOXMaker CLI Tool")
 
     subparsers = parser.add_subparsers(dest="command")
@@ -39,9 +45,22 @@ def cli_main():
 
     args = parser.parse_args()
 
-    if args.command == "validate":
-        validate_rules()
-    elif args.command == "list-mods":
-        list_mods()
+    if args.command in COMMANDS:
+        COMMANDS[args.command]()
     else:
         parser.print_help()
+
+
+COMMANDS = {
+    "validate": validate_rules,
+    "list-mods": list_mods,
+}
+
+
+def cli_main():
+    """CLI Entry Point"""
+    # Fast path: exactly one known command and nothing else
+    if len(sys.argv) == 2 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]]()
+    else:
+        _parse_with_argparse()
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+CONFIG_DIR = Path.home() / ".config" / "mloxmaker"
+
 
 class Settings:
     """Default application settings."""
@@ -11,12 +13,12 @@ class Settings:
     # 🔹 Logging
     LOGGER_NAME = "MLOXMaker"
     LOG_LEVEL = "INFO"
-    LOG_FILE_PATH = Path.home() / ".config" / "mloxmaker" / "mloxmaker.log"
+    LOG_FILE_PATH = CONFIG_DIR / "mloxmaker.log"
     TOGGLE_STDOUT_LOGGING = True
     TOGGLE_FILE_LOGGING = False
 
     # 🔹 Database
-    DATABASE_PATH = Path.home() / ".config" / "mloxmaker" / "mloxmaker.db"
+    DATABASE_PATH = CONFIG_DIR / "mloxmaker.db"
 
     # 🔹 UI Settings
     THEME = "dark"
@@ -26,10 +28,13 @@ class Settings:
     ENABLE_CLI_MODE = True
     ENABLE_EVENT_DEBUGGING = False
 
+    _dirs_ready = False
+
     @classmethod
     def ensure_dirs(cls):
-        """Ensure required directories exist."""
+        """Ensure required directories exist (only touches the filesystem on the first call)."""
+        if cls._dirs_ready:
+            return
         cls.LOG_FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        cls.DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-Settings.ensure_dirs()
+        Path(cls.DATABASE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        cls._dirs_ready = True
@@ -10,22 +10,48 @@ class ErrorLevel(StrEnum):
     RECOVERABLE = auto()   # 🔄 Operation failed but app remains stable
     CRITICAL = auto()      # ❌ Major failure, execution stops
 
+
+# AppLog method used for each severity. Names (not bound methods) keep AppLog patchable at call time.
+_LOG_METHOD_BY_LEVEL = {
+    ErrorLevel.WARNING: "warning",
+    ErrorLevel.RECOVERABLE: "info",
+    ErrorLevel.CRITICAL: "error",
+}
+
+
+def _rebuild_error(cls, args, state):
+    """Restores a pickled/copied MLOXError without re-running __init__ (so it is not logged twice)."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class MLOXError(Exception):
     """Base class for all MLOXMaker errors, ensuring structured logging."""
+    __slots__ = ("level", "details")
+
     def __init__(self, message: str, level: ErrorLevel = ErrorLevel.CRITICAL, details: str | None = None):
         super().__init__(message)
         self.level = level
         self.details = details  # Optional debugging details
         self.log_error()
 
+    def __reduce__(self):
+        """Carries slot values through pickle/copy, which BaseException.__reduce__ would drop (it only sees __dict__)."""
+        state = {
+            name: getattr(self, name)
+            for klass in type(self).__mro__
+            for name in getattr(klass, "__slots__", ())
+            if hasattr(self, name)
+        }
+        state.update(self.__dict__)
+        return _rebuild_error, (type(self), self.args, state)
+
     def log_error(self):
         """Logs the error based on its severity level."""
-        log_methods = {
-            ErrorLevel.WARNING: AppLog.warning,
-            ErrorLevel.RECOVERABLE: AppLog.info,
-            ErrorLevel.CRITICAL: AppLog.error,
-        }
-        log_method = log_methods.get(self.level.lower(), AppLog.error)
+        log_method = getattr(AppLog, _LOG_METHOD_BY_LEVEL.get(self.level, "error"))
         # noinspection PyArgumentList
         log_method(LogGroup.SYSTEM, LogEvent.FAILED, f"{self.__class__.__name__}: {self}", terse=self.details)
 
@@ -35,9 +61,11 @@ class MLOXError(Exception):
 # ======================================================================================================================
 class MLOXRuleError(MLOXError):
     """Base class for all rule-related errors."""
-    pass
+    __slots__ = ()
 class InvalidRuleSyntaxError(MLOXRuleError):
     """Raised when a rule is incorrectly formatted."""
+    __slots__ = ()
+
     def __init__(self, rule_text: str):
         super().__init__(
             message=f"Invalid rule syntax: {rule_text}", level=ErrorLevel.RECOVERABLE,
@@ -46,6 +74,8 @@ class InvalidRuleSyntaxError(MLOXRuleError):
 
 class MissingModError(MLOXRuleError):
     """Raised when a rule references a mod that does not exist."""
+    __slots__ = ()
+
     def __init__(self, mod_name: str):
         super().__init__(
             f"Mod not found: {mod_name}", level=ErrorLevel.RECOVERABLE,
@@ -54,6 +84,8 @@ class MissingModError(MLOXRuleError):
 
 class CircularDependencyError(MLOXRuleError):
     """Raised when a circular dependency is detected in mod rules."""
+    __slots__ = ()
+
     def __init__(self, mod_name: str):
         super().__init__(
             message=f"Circular dependency detected for: {mod_name}", level=ErrorLevel.CRITICAL,
@@ -62,6 +94,8 @@ class CircularDependencyError(MLOXRuleError):
 
 class ConflictingRuleError(MLOXRuleError):
     """Raised when contradictory rules are detected."""
+    __slots__ = ()
+
     def __init__(self, rule_a: str, rule_b: str):
         super().__init__(
             message=f"Conflicting rules detected: {rule_a} <-> {rule_b}", level=ErrorLevel.CRITICAL,
@@ -74,10 +108,12 @@ class ConflictingRuleError(MLOXRuleError):
 # ======================================================================================================================
 class MLOXAPIError(MLOXError):
     """Base class for all API-related errors."""
-    pass
+    __slots__ = ()
 
 class NexusAPIFetchError(MLOXAPIError):
     """Raised when the Nexus Mods API fails to return a response."""
+    __slots__ = ()
+
     def __init__(self, query: str):
         super().__init__(
             message=f"Failed to fetch data for: {query}", level=ErrorLevel.RECOVERABLE,
@@ -86,6 +122,8 @@ class NexusAPIFetchError(MLOXAPIError):
 
 class NexusRateLimitError(MLOXAPIError):
     """Raised when the Nexus Mods API rate limit is exceeded."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             message="Nexus API rate limit exceeded.", level=ErrorLevel.WARNING,
@@ -94,6 +132,8 @@ class NexusRateLimitError(MLOXAPIError):
 
 class InvalidAPICredentials(MLOXAPIError):
     """Raised when the provided API key is invalid or missing."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             message="Invalid or missing Nexus API key.", level=ErrorLevel.CRITICAL,
@@ -102,6 +142,8 @@ class InvalidAPICredentials(MLOXAPIError):
 
 class ModMetadataParseError(MLOXAPIError):
     """Raised when mod metadata from the API fails to parse correctly."""
+    __slots__ = ()
+
     def __init__(self, mod_name: str):
         super().__init__(
             message=f"Failed to parse metadata for mod: {mod_name}", level=ErrorLevel.RECOVERABLE,
@@ -114,12 +156,16 @@ class ModMetadataParseError(MLOXAPIError):
 # ======================================================================================================================
 class MLOXIOError(MLOXError):
     """Base class for all file-related errors, enforcing pathlib paths."""
+    __slots__ = ("file_path",)
+
     def __init__(self, file_path: str | Path, message: str, level: ErrorLevel, details: str | None = None):
         self.file_path = Path(file_path)
         super().__init__(f"{message}: {self.file_path}", level=level, details=details)
 
 class MissingFileError(MLOXIOError):
     """Raised when a required file is missing."""
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         super().__init__(
             file_path, message="File not found", level=ErrorLevel.CRITICAL,
@@ -128,6 +174,8 @@ class MissingFileError(MLOXIOError):
 
 class ExistingFileError(MLOXIOError):
     """Raised when trying to overwrite an existing file without permission."""
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         super().__init__(
             file_path, message="File already exists", level=ErrorLevel.WARNING,
@@ -136,6 +184,8 @@ class ExistingFileError(MLOXIOError):
 
 class FilePermissionError(MLOXIOError):
     """Raised when lacking permission to read/write a file."""
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         super().__init__(
             file_path, message="Insufficient permissions for file", level=ErrorLevel.CRITICAL,
@@ -144,6 +194,8 @@ class FilePermissionError(MLOXIOError):
 
 class ExportFailureError(MLOXIOError):
     """Raised when exporting rules to a file fails."""
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         super().__init__(
             file_path, message="Failed to export rules", level=ErrorLevel.RECOVERABLE,
@@ -152,6 +204,8 @@ class ExportFailureError(MLOXIOError):
 
 class CorruptRuleFileError(MLOXIOError):
     """Raised when a rule file is detected as corrupted."""
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         super().__init__(
             file_path, message="Corrupt rule file detected", level=ErrorLevel.CRITICAL,
@@ -1,24 +1,69 @@
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event, Engine
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
+from sqlalchemy.pool import QueuePool
 from MLOXMaker.config.settings import Settings
 from pathlib import Path
 
-DATABASE_URL = f"sqlite:///{Settings.DATABASE_PATH}"
+# PRAGMAs applied to every new pooled connection (WAL, relaxed fsync, in-memory temp tables, 64 MiB cache, 256 MiB mmap)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
 
-# Ensure database directory exists
-Path(Settings.DATABASE_PATH).parent.mkdir(parents=True, exist_ok=True)
+# The engine and session factory are built on first use, so code paths that never touch the DB skip them.
+_engine: Engine | None = None
+SessionLocal: sessionmaker | None = None
 
-# Create the SQLAlchemy engine
-engine = create_engine(DATABASE_URL, echo=False, future=True)
+# Base class for models
+class Base(DeclarativeBase):
+    pass
 
-# Create a session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Base class for models
-Base = declarative_base()
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tunes each new raw SQLite connection as it enters the pool."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def get_engine() -> Engine:
+    """Returns the SQLAlchemy engine, creating it (and the database directory) on first call."""
+    global _engine
+    if _engine is None:
+        # Ensure database directory exists
+        Path(Settings.DATABASE_PATH).parent.mkdir(parents=True, exist_ok=True)
+
+        # Pooled, so connections are reused instead of reopened per session
+        _engine = create_engine(
+            f"sqlite:///{Settings.DATABASE_PATH}",
+            echo=False,
+            future=True,
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=False,
+            connect_args={"check_same_thread": False},
+        )
+        event.listen(_engine, "connect", _apply_sqlite_pragmas)
+    return _engine
+
+
+def get_session() -> Session:
+    """Returns a new session, creating the session factory on first call."""
+    global SessionLocal
+    if SessionLocal is None:
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return SessionLocal()
+
 
 def initialize():
     """Initialize the database (create tables if needed)."""
     from MLOXMaker.database.models import Rule, Mod, Dependency  # Import models
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
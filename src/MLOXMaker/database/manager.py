@@ -1,58 +1,166 @@
 
-from MLOXMaker.database.db import SessionLocal, engine, Base
+from typing import Iterable
+
+from sqlalchemy import Row, func, insert, select
+from sqlalchemy.exc import IntegrityError
+
+from MLOXMaker.config.settings import Settings
+from MLOXMaker.database import db
+from MLOXMaker.database.db import Base
 from MLOXMaker.database.models import Rule, Mod, Dependency
+from MLOXMaker.managers.app_log import AppLog, LogGroup, LogEvent
 
 class DatabaseManager:
     """Manages database interactions for MLOXMaker."""
 
+    # Read-aside cache of full-table reads, keyed by table name and invalidated on every write.
+    _cache: dict[str, list] = {}
+
     @staticmethod
     def get_session():
         """Returns a new database session."""
-        return SessionLocal()
+        return db.get_session()
 
-    @staticmethod
-    def initialize():
+    @classmethod
+    def initialize(cls):
         """Ensures all tables are created before using the database."""
+        Settings.ensure_dirs()
+        engine = db.get_engine()
         Base.metadata.create_all(bind=engine)
+        cls._create_missing_indexes(engine)
+        cls.invalidate_cache()
 
     @staticmethod
-    def add_rule(rule_type, mod_name, target_mod=None, severity=None, notes=None):
-        """Adds a new rule to the database."""
-        with DatabaseManager.get_session() as session:
-            rule = Rule(rule_type=rule_type, mod_name=mod_name, target_mod=target_mod, severity=severity, notes=notes)
-            session.add(rule)
+    def _create_missing_indexes(engine):
+        """(Private) Adds indexes that tables created by an older schema lack (create_all skips existing tables)."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(bind=engine, checkfirst=True)
+                except IntegrityError:
+                    # A unique index over rows that already hold duplicates: keep the data, skip the index.
+                    AppLog.warning(
+                        LogGroup.SYSTEM, LogEvent.FAILED, f"Could not create index {index.name}",
+                        terse="Existing rows violate its uniqueness; remove the duplicates and restart."
+                    )
+
+    @classmethod
+    def invalidate_cache(cls, *keys: str):
+        """Drops cached reads for the given table names (or all of them when none are given)."""
+        if not keys:
+            cls._cache.clear()
+        for key in keys:
+            cls._cache.pop(key, None)
+
+    @classmethod
+    def _get_all(cls, model) -> list:
+        """(Private) Returns every row of a model, served from the cache when possible."""
+        key = model.__tablename__
+        rows = cls._cache.get(key)
+        if rows is None:
+            with cls.get_session() as session:
+                rows = cls._cache[key] = session.query(model).all()
+        return rows
+
+    @classmethod
+    def _count(cls, model) -> int:
+        """(Private) Returns the number of rows in a model's table without loading any of them."""
+        with cls.get_session() as session:
+            return session.scalar(select(func.count()).select_from(model))
+
+    @classmethod
+    def _get_first(cls, model):
+        """(Private) Returns the lowest-id row of a model (or None), loading only that row."""
+        with cls.get_session() as session:
+            return session.scalars(select(model).order_by(model.id).limit(1)).first()
+
+    @classmethod
+    def _bulk_insert(cls, model, rows: Iterable[dict]):
+        """(Private) Inserts many rows of a model in one statement and a single commit."""
+        rows = list(rows)
+        if not rows:
+            return
+        with cls.get_session() as session:
+            session.execute(insert(model), rows)
             session.commit()
+        cls.invalidate_cache(model.__tablename__)
 
-    @staticmethod
-    def get_rules():
+    @classmethod
+    def add_rule(cls, rule_type, mod_name, target_mod=None, severity=None, notes=None):
+        """Adds a new rule to the database."""
+        cls.add_rules([
+            {"rule_type": rule_type, "mod_name": mod_name, "target_mod": target_mod, "severity": severity,
+             "notes": notes}
+        ])
+
+    @classmethod
+    def add_rules(cls, rules: Iterable[dict]):
+        """Adds many rules (dicts of Rule column values) in a single transaction."""
+        cls._bulk_insert(Rule, rules)
+
+    @classmethod
+    def get_rules(cls):
         """Retrieves all rules from the database."""
-        with DatabaseManager.get_session() as session:
-            return session.query(Rule).all()
+        return cls._get_all(Rule)
 
-    @staticmethod
-    def add_mod(mod_name, mod_hash=None, source=None):
+    @classmethod
+    def count_rules(cls) -> int:
+        """Returns the number of stored rules."""
+        return cls._count(Rule)
+
+    @classmethod
+    def get_first_rule(cls):
+        """Retrieves the first stored rule, or None."""
+        return cls._get_first(Rule)
+
+    @classmethod
+    def iter_rule_summaries(cls) -> list[Row]:
+        """Retrieves lightweight (rule_type, mod_name, target_mod) rows without building ORM objects."""
+        with cls.get_session() as session:
+            return session.execute(select(Rule.rule_type, Rule.mod_name, Rule.target_mod)).all()
+
+    @classmethod
+    def add_mod(cls, mod_name, mod_hash=None, source=None):
         """Adds a new mod to the database."""
-        with DatabaseManager.get_session() as session:
-            mod = Mod(mod_name=mod_name, mod_hash=mod_hash, source=source)
-            session.add(mod)
-            session.commit()
+        cls.add_mods([{"mod_name": mod_name, "mod_hash": mod_hash, "source": source}])
 
-    @staticmethod
-    def get_mods():
+    @classmethod
+    def add_mods(cls, mods: Iterable[dict]):
+        """Adds many mods (dicts of Mod column values) in a single transaction."""
+        cls._bulk_insert(Mod, mods)
+
+    @classmethod
+    def get_mods(cls):
         """Retrieves all mods from the database."""
-        with DatabaseManager.get_session() as session:
-            return session.query(Mod).all()
+        return cls._get_all(Mod)
 
-    @staticmethod
-    def add_dependency(mod_id, depends_on_id):
+    @classmethod
+    def count_mods(cls) -> int:
+        """Returns the number of stored mods."""
+        return cls._count(Mod)
+
+    @classmethod
+    def get_first_mod(cls):
+        """Retrieves the first stored mod, or None."""
+        return cls._get_first(Mod)
+
+    @classmethod
+    def iter_mod_summaries(cls) -> list[Row]:
+        """Retrieves lightweight (mod_name, source) rows without building ORM objects."""
+        with cls.get_session() as session:
+            return session.execute(select(Mod.mod_name, Mod.source)).all()
+
+    @classmethod
+    def add_dependency(cls, mod_id, depends_on_id):
         """Adds a dependency between two mods."""
-        with DatabaseManager.get_session() as session:
-            dep = Dependency(mod_id=mod_id, depends_on=depends_on_id)
-            session.add(dep)
-            session.commit()
+        cls.add_dependencies([{"mod_id": mod_id, "depends_on": depends_on_id}])
 
-    @staticmethod
-    def get_dependencies():
+    @classmethod
+    def add_dependencies(cls, dependencies: Iterable[dict]):
+        """Adds many dependencies (dicts of Dependency column values) in a single transaction."""
+        cls._bulk_insert(Dependency, dependencies)
+
+    @classmethod
+    def get_dependencies(cls):
         """Retrieves all dependencies."""
-        with DatabaseManager.get_session() as session:
-            return session.query(Dependency).all()
+        return cls._get_all(Dependency)
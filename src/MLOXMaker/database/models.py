@@ -1,53 +1,57 @@
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from typing import Optional
+
+from sqlalchemy import Integer, String, ForeignKey, Text, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .db import Base
 
 class Rule(Base):
     """Stores mlox rules (Order, Conflict, Requires, NearStart, NearEnd, Patch, etc.)."""
     __tablename__ = "rules"
 
-    id              = Column(Integer, primary_key=True, index=True)
-    rule_type       = Column(String, nullable=False)    # [Order], [Conflict], [Requires], etc.
-    mod_name        = Column(String, nullable=False)    # The main mod this rule applies to
-    target_mod      = Column(String, nullable=True)     # Optional secondary mod
-    severity        = Column(String, nullable=True)     # Conflict severity (Low, Medium, High)
-    priority_level  = Column(Integer, nullable=True)    # 1 (!), 2 (!!), 3 (!!!) for highlighting
-    section         = Column(String, nullable=True)     # The @SectionName grouping
-    reference       = Column(Text, nullable=True)       # Stores the (Ref: ) source information
-    notes           = Column(Text, nullable=True)       # User notes
+    id              : Mapped[int]           = mapped_column(Integer, primary_key=True, index=True)
+    rule_type       : Mapped[str]           = mapped_column(String)            # [Order], [Conflict], [Requires], etc.
+    mod_name        : Mapped[str]           = mapped_column(String, index=True)  # The main mod this rule applies to
+    target_mod      : Mapped[Optional[str]] = mapped_column(String, index=True)  # Optional secondary mod
+    severity        : Mapped[Optional[str]] = mapped_column(String)            # Conflict severity (Low, Medium, High)
+    priority_level  : Mapped[Optional[int]] = mapped_column(Integer)           # 1 (!), 2 (!!), 3 (!!!) for highlighting
+    section         : Mapped[Optional[str]] = mapped_column(String)            # The @SectionName grouping
+    reference       : Mapped[Optional[str]] = mapped_column(Text)              # Stores the (Ref: ) source information
+    notes           : Mapped[Optional[str]] = mapped_column(Text)              # User notes
+
+    predicates      : Mapped[list["Predicate"]] = relationship(back_populates="rule", cascade="all, delete-orphan")
 
 class Mod(Base):
     """Stores mod metadata (installed mods & Nexus lookups)."""
     __tablename__ = "mods"
 
-    id = Column(Integer, primary_key=True, index=True)
-    mod_name        = Column(String, nullable=False, unique=True)
-    mod_hash        = Column(String, unique=True, nullable=True)        # Optional file hash
-    source          = Column(String, nullable=True)                     # Local or Nexus
-    last_updated    = Column(String, nullable=True)                     # Timestamp
+    id              : Mapped[int]           = mapped_column(Integer, primary_key=True, index=True)
+    mod_name        : Mapped[str]           = mapped_column(String, unique=True)
+    mod_hash        : Mapped[Optional[str]] = mapped_column(String, unique=True)   # Optional file hash
+    source          : Mapped[Optional[str]] = mapped_column(String)                # Local or Nexus
+    last_updated    : Mapped[Optional[str]] = mapped_column(String)                # Timestamp
 
 class Dependency(Base):
     """Stores mod-to-mod dependencies."""
     __tablename__ = "dependencies"
+    __table_args__ = (
+        Index("ix_dep_mod_depends", "mod_id", "depends_on", unique=True),   # Lookups by mod; no duplicate edges
+    )
 
-    id              = Column(Integer, primary_key=True, index=True)
-    mod_id          = Column(Integer, ForeignKey("mods.id"), nullable=False)
-    depends_on      = Column(Integer, ForeignKey("mods.id"), nullable=False)
+    id              : Mapped[int]           = mapped_column(Integer, primary_key=True, index=True)
+    mod_id          : Mapped[int]           = mapped_column(Integer, ForeignKey("mods.id"))
+    depends_on      : Mapped[int]           = mapped_column(Integer, ForeignKey("mods.id"))
 
-    mod             = relationship("Mod", foreign_keys=[mod_id])
-    required_mod    = relationship("Mod", foreign_keys=[depends_on])
+    mod             : Mapped["Mod"]         = relationship(foreign_keys=[mod_id])
+    required_mod    : Mapped["Mod"]         = relationship(foreign_keys=[depends_on])
 
 class Predicate(Base):
     """Stores predicates like DESC, SIZE, VER for advanced rule filtering."""
     __tablename__ = "predicates"
 
-    id              = Column(Integer, primary_key=True, index=True)
-    rule_id         = Column(Integer, ForeignKey("rules.id"), nullable=False)
-    predicate_type  = Column(String, nullable=False)                    # DESC, SIZE, VER, etc.
-    predicate_value = Column(String, nullable=False)                    # The associated value
-
-    rule = relationship("Rule", back_populates="predicates")
-
+    id              : Mapped[int]           = mapped_column(Integer, primary_key=True, index=True)
+    rule_id         : Mapped[int]           = mapped_column(Integer, ForeignKey("rules.id"), index=True)
+    predicate_type  : Mapped[str]           = mapped_column(String)                 # DESC, SIZE, VER, etc.
+    predicate_value : Mapped[str]           = mapped_column(String)                 # The associated value
 
-Rule.predicates = relationship("Predicate", back_populates="rule", cascade="all, delete-orphan")
+    rule            : Mapped["Rule"]        = relationship(back_populates="predicates")
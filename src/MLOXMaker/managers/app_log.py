@@ -32,11 +32,15 @@ Usage:
 Happy logging!
 """
 
+import atexit
+import functools
 import logging
 import os
+import queue
 import sys
 from dataclasses import dataclass
 from enum import StrEnum, auto
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
@@ -51,6 +55,18 @@ except ImportError as e:
 #                                                                                                             🔥 Logger
 # ======================================================================================================================
 
+# Level name → stdlib level number, so level changes don't go through getattr(logging, ...).
+# Includes the stdlib aliases (WARN, FATAL, NOTSET) that getattr(logging, name) used to accept.
+_LEVEL_MAP = {
+    "NOTSET"    : logging.NOTSET,
+    "DEBUG"     : logging.DEBUG,
+    "INFO"      : logging.INFO,
+    "WARN"      : logging.WARNING,
+    "WARNING"   : logging.WARNING,
+    "ERROR"     : logging.ERROR,
+    "FATAL"     : logging.CRITICAL,
+    "CRITICAL"  : logging.CRITICAL,
+}
 
 @dataclass
 class LogConfig:
@@ -62,8 +78,12 @@ class LogConfig:
     log_file_path: Path             = Path.home() / "app.log"
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_settings(cls):
-        """Creates a LogConfig object from application settings."""
+        """Creates a LogConfig object from application settings.
+
+        The result is cached; call ``LogConfig.from_settings.cache_clear()`` after changing Settings.
+        """
         return cls(
             logger_name             =getattr(Settings, "LOGGER_NAME", "APP_LOGGER"),
             log_level               =getattr(Settings, "LOG_LEVEL", "DEBUG").upper(),
@@ -86,6 +106,14 @@ class LogEvent(StrEnum):
     FAILED              = auto()        # An operation has failed
 
 
+class _AppAdapter(logging.LoggerAdapter):
+    """(Private) Adapter bound to one (group, event) pair, reusing a single extra dict for every call."""
+
+    def process(self, msg, kwargs):
+        kwargs["extra"] = self.extra
+        return msg, kwargs
+
+
 class AppLog:
     """Centralized logger with structured groups & events.
 
@@ -95,10 +123,21 @@ class AppLog:
     """
     _config: LogConfig | None = None
     _initialized: bool = False
+    # Installed when headless; while it is the only handler, every wrapper call returns before touching the logger.
+    _null_handler: Optional[logging.NullHandler] = None
 
     # Static reference to the logger.
     logger: Optional[logging.Logger] = None
 
+    # Background listener that drains queued records into the file handler.
+    _file_listener: Optional[QueueListener] = None
+
+    # Single formatter shared by every handler, built on first use (AppLogFormatter is defined below).
+    _SHARED_FORMATTER: Optional["AppLogFormatter"] = None
+
+    # One adapter per (group, event) pair, bound to the current logger.
+    _adapters: dict[tuple[LogGroup, LogEvent], _AppAdapter] = {}
+
     class Level(StrEnum):
         """Logging severity levels (specific to AppLog)."""
         DEBUG           = auto()        # Detailed debugging information
@@ -128,15 +167,20 @@ class AppLog:
 
         cls._config = config or LogConfig.from_settings()
         cls.logger = logging.getLogger(cls._config.logger_name)
+        cls._adapters.clear()
+        cls._stop_file_listener()
         cls.logger.handlers.clear()
         cls.logger.propagate = False  # Prevent messages from propagating to the root logger.
 
-        cls.logger.setLevel(getattr(logging, cls._config.log_level.upper(), logging.DEBUG))
+        cls.logger.setLevel(_LEVEL_MAP.get(cls._config.log_level.upper(), logging.DEBUG))
 
         if cls._config.toggle_file_logging:
             cls.toggle_file_logging(True, cls._config.log_file_path)
         if cls._config.toggle_console_logging:
             cls.toggle_console_logging(True, cls.logger)
+        if not cls.logger.handlers:
+            cls._null_handler = logging.NullHandler()
+            cls.logger.addHandler(cls._null_handler)  # Headless: no output, and no lastResort stderr fallback
 
         cls._initialized = True
 
@@ -153,15 +197,25 @@ class AppLog:
 
     @classmethod
     def toggle_file_logging(cls, enabled: bool, file_path: Optional[Path] = None):
-        """Enables or disables file logging, allowing users to specify a file path."""
+        """Enables or disables file logging, allowing users to specify a file path.
+
+        Records are handed to a QueueHandler and written by a background QueueListener,
+        so logging calls never block on disk I/O.
+        """
         logger = cls.logger or logging.getLogger("APP_LOGGER")
-        cls._remove_handlers(logger, logging.FileHandler)
+        cls._remove_handlers(logger, QueueHandler)
+        cls._stop_file_listener()
 
         if enabled:
             log_path = Path(file_path) if isinstance(file_path, (str, Path)) else Path.home() / "app.log"
             log_path.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(str(log_path), mode='a', encoding="utf-8")
-            cls._add_handler(logger, file_handler, AppLogFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+            file_handler.setFormatter(cls._shared_formatter())
+
+            log_queue = queue.SimpleQueue()
+            cls._file_listener = QueueListener(log_queue, file_handler)
+            cls._file_listener.start()
+            logger.addHandler(QueueHandler(log_queue))
             logger.info(
                 f"File logging enabled at {log_path} → Hello file! :)",
                 extra={"group": LogGroup.SYSTEM, "event": LogEvent.COMPLETED}
@@ -172,26 +226,41 @@ class AppLog:
                 extra={"group": LogGroup.SYSTEM, "event": LogEvent.COMPLETED}
             )
 
+    @classmethod
+    def _shared_formatter(cls) -> "AppLogFormatter":
+        """(Private) Returns the formatter shared by all handlers, creating it on first use."""
+        if cls._SHARED_FORMATTER is None:
+            cls._SHARED_FORMATTER = AppLogFormatter(datefmt="%Y-%m-%d %H:%M:%S")
+        return cls._SHARED_FORMATTER
+
+    @classmethod
+    def _stop_file_listener(cls):
+        """(Private) Stops the file listener, flushing queued records and closing the log file."""
+        listener, cls._file_listener = cls._file_listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
     @staticmethod
     def toggle_console_logging(enabled: bool, logger: logging.Logger = None):
         """Enables or disables console logging, ensuring correct separation of stdout and stderr."""
         logger = logger or logging.getLogger("APP_LOGGER")
 
         # Remove existing StreamHandlers
-        for handler in logger.handlers[:]:
-            if isinstance(handler, logging.StreamHandler):
-                logger.removeHandler(handler)
+        AppLog._remove_handlers(logger, logging.StreamHandler)
 
         if enabled:
             # Normal logs (INFO, DEBUG) → stdout
             stdout_handler = logging.StreamHandler(sys.stdout)
             stdout_handler.setLevel(logging.DEBUG)  # Includes INFO & DEBUG
-            AppLog._add_handler(logger, stdout_handler, AppLogFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+            AppLog._add_handler(logger, stdout_handler, AppLog._shared_formatter())
 
             # Warnings & Errors → stderr
             stderr_handler = logging.StreamHandler(sys.stderr)
             stderr_handler.setLevel(logging.WARNING)  # Includes WARNING, ERROR, CRITICAL
-            AppLog._add_handler(logger, stderr_handler, AppLogFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+            AppLog._add_handler(logger, stderr_handler, AppLog._shared_formatter())
 
             logger.info("Console logging enabled → stdout for info, stderr for errors",
                         extra={"group": LogGroup.SYSTEM, "event": LogEvent.COMPLETED})
@@ -203,7 +272,7 @@ class AppLog:
     def set_log_level(cls, new_level: str, logger: logging.Logger = None):
         """Dynamically sets the global log level for the provided logger (or defaults to the app logger)."""
         logger = logger or cls.get_logger()
-        logger.setLevel(getattr(logging, new_level.upper(), logging.DEBUG))
+        logger.setLevel(_LEVEL_MAP.get(new_level.upper(), logging.DEBUG))
         cls.info(
             LogGroup.SYSTEM, LogEvent.COMPLETED, f"Log level set to {new_level.upper()}",
             terse="Log level updated."
@@ -244,9 +313,19 @@ class AppLog:
         This method is for internal use only.
         """
         logger = cls.get_logger()
-        log_method = getattr(logger, level.name.lower(), logger.info)
+        # Checked live (not cached), so handlers attached directly by an embedding host are never missed.
+        handlers = logger.handlers
+        if not handlers or (len(handlers) == 1 and handlers[0] is cls._null_handler):
+            return  # Nothing would be emitted: skip the logging machinery entirely.
+        py_level = _LEVEL_MAP[level.name]
+        if not logger.isEnabledFor(py_level):
+            return  # Filtered out: skip building the message and extras.
         formatted_message = f"{report} {'→ ' + terse if terse else ''}"
-        log_method(formatted_message, extra={"group": group, "event": event})
+        adapter = cls._adapters.get((group, event))
+        if adapter is None or adapter.logger is not logger:
+            # Plain str values keep enum __format__ dispatch out of the formatter's per-record path.
+            adapter = cls._adapters[(group, event)] = _AppAdapter(logger, {"group": str(group), "event": str(event)})
+        adapter.log(py_level, formatted_message)
 
     @staticmethod
     def _add_handler(logger: logging.Logger, handler: logging.Handler, formatter: logging.Formatter):
@@ -256,38 +335,69 @@ class AppLog:
 
     @staticmethod
     def _remove_handlers(logger: logging.Logger, handler_type: type[logging.Handler]):
-        """(Private) Removes all handlers of a specific type from the logger."""
-        for handler in logger.handlers[:]:
-            if isinstance(handler, handler_type):
-                logger.removeHandler(handler)
+        """(Private) Removes all handlers of a specific type from the logger.
+
+        Rebuilds the list in one pass instead of calling removeHandler per match. The filter and
+        rebind run under logging's module lock (the one addHandler/removeHandler take), so a handler
+        added concurrently cannot be lost between building the new list and assigning it.
+        """
+        with logging._lock:  # Private, but it is the lock every Logger.addHandler/removeHandler holds
+            logger.handlers = [handler for handler in logger.handlers if not isinstance(handler, handler_type)]
+
+
+# Emoji per stdlib level number, so the formatter can key on record.levelno directly.
+_EMOJI_BY_LEVELNO = {_LEVEL_MAP[level.name]: emoji for level, emoji in AppLog.EMOJIS.items()}
+_DEFAULT_EMOJI = AppLog.EMOJIS[AppLog.Level.INFO]
+
+# Drain any queued file records before the interpreter (and logging.shutdown) tears handlers down.
+atexit.register(AppLog._stop_file_listener)
 
 
 # ======================================================================================================================
 #                                                                                                         🎨 Formatters
 # ======================================================================================================================
+def _padded_tags(values, width: int) -> dict[str, str]:
+    """(Private) Maps each value to its upper-cased "[VALUE   ]" tag, padded to the given width."""
+    return {value: f"[{value:<{width - 2}}]".upper() for value in values}
+
+
 class AppLogFormatter(logging.Formatter):
     """Custom formatter to inject emojis and groups into log output with aligned spacing."""
     LEVEL_WIDTH     = 9
     TAG_WIDTH       = 10
     EVENT_WIDTH     = 11
 
+    # Levels, groups and events are closed sets, so their padded tags are built once here.
+    _LEVEL_STR      = _padded_tags(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"), LEVEL_WIDTH)
+    _GROUP_STR      = _padded_tags(LogGroup, TAG_WIDTH)
+    _EVENT_STR      = _padded_tags(LogEvent, EVENT_WIDTH)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Under pytest, emit one leading newline so the first record doesn't share a line with pytest's output.
+        self._pending_newline = "PYTEST_CURRENT_TEST" in os.environ
+
     def format(self, record: logging.LogRecord) -> str:
-        record.emoji = AppLog.EMOJIS.get(getattr(AppLog.Level, record.levelname.upper(), AppLog.Level.INFO), "")
+        record.emoji = _EMOJI_BY_LEVELNO.get(record.levelno, _DEFAULT_EMOJI)
         record.group = getattr(record, "group", "UNKNOWN")
         record.event = getattr(record, "event", "UNKNOWN")
         record.asctime = self.formatTime(record, self.datefmt)
 
-        level_string = self.format_spec(record.levelname, self.LEVEL_WIDTH)
-        group_string = self.format_spec(record.group, self.TAG_WIDTH)
-        event_string = self.format_spec(record.event, self.EVENT_WIDTH)
+        level_string = self._tag(self._LEVEL_STR, record.levelname, self.LEVEL_WIDTH)
+        group_string = self._tag(self._GROUP_STR, record.group, self.TAG_WIDTH)
+        event_string = self._tag(self._EVENT_STR, record.event, self.EVENT_WIDTH)
         logger_message = record.getMessage()
 
-        if "PYTEST_CURRENT_TEST" in os.environ and sys.stdout.tell() == 0:
+        if self._pending_newline:
+            self._pending_newline = False
             print(flush=True)
-        return (
-            f"{record.emoji} {level_string.upper()} {group_string.upper()} "
-            f"{event_string.upper()} {record.asctime} - {logger_message}"
-        )
+        return f"{record.emoji} {level_string} {group_string} {event_string} {record.asctime} - {logger_message}"
+
+    @classmethod
+    def _tag(cls, table: dict[str, str], value, width: int) -> str:
+        """(Private) Looks up a precomputed tag, formatting values outside the known set on the fly."""
+        tag = table.get(value)
+        return tag if tag is not None else cls.format_spec(value, width).upper()
 
     @staticmethod
     def format_spec(value, width):
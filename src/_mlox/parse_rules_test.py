@@ -1,14 +1,13 @@
+import sys
+
 from _mlox.mlox_parser import rule_parser
 
 RULE_FILE = "mlox_base.txt"
 
 class NameConverter:
-    """A dummy name converter that returns names unchanged."""
-    def cname(self, name):
-        return name
-
-    def truename(self, name):
-        return name
+    """A dummy name converter that returns names unchanged (interned, so later dict/set lookups are cheap)."""
+    cname = staticmethod(sys.intern)
+    truename = staticmethod(sys.intern)
 
 def load_and_print_rules():
     """Loads rules from `mlox_base.txt` and prints them."""
@@ -16,8 +15,9 @@ def load_and_print_rules():
     success = parser.read_rules(RULE_FILE)
 
     if success:
-        print("✅ Rules loaded successfully!\n")
-        print(parser.get_messages())  # 🔥 Print parsed rule messages
+        sys.stdout.write("✅ Rules loaded successfully!\n\n")
+        sys.stdout.write(parser.get_messages() + "\n")  # 🔥 Print parsed rule messages in a single write
+        sys.stdout.flush()
     else:
         print("❌ Failed to parse rules.")
 
@@ -1,15 +1,22 @@
+import os
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from MLOXMaker.database.db import Base, engine, SessionLocal
-from MLOXMaker.database.manager import DatabaseManager
 from MLOXMaker.managers.app_log import AppLog
 
+# Database modules (and SQLAlchemy) are imported inside the fixtures below, so tests that never
+# request `test_db` don't pay for them at collection time. Only the cheap settings guard is autouse.
+
 def pytest_configure(config):
     """Automatically enable test mode in AppLog when pytest runs."""
     AppLog.testing_mode = True
 
+# One log file for the whole session; file-logging tests truncate it instead of making their own.
+@pytest.fixture(scope="session")
+def shared_log_file(tmp_path_factory):
+    return tmp_path_factory.mktemp("logs") / "test_app.log"
+
 # Override the database settings by patching the Settings class.
+# Autouse (it only imports Settings, not SQLAlchemy), so no test can reach the developer's real database.
 @pytest.fixture(scope="session", autouse=True)
 def override_database_settings():
     from MLOXMaker.config.settings import Settings
@@ -19,45 +26,92 @@ def override_database_settings():
     yield
     mp.undo()
 
+def _enable_sqlite_savepoints(engine):
+    """Lets SQLAlchemy, not pysqlite, emit BEGIN so SAVEPOINTs and the outer rollback behave."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
 # Rebind the engine to an in-memory database.
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def rebind_db_engine(override_database_settings):
+    """
+    Points MLOXMaker.database.db at a session-scoped, in-memory engine.
+
+    The engine is ephemeral: there is no dispose or drop_all on either side, since the in-memory DB
+    (and any engine it replaced) is reclaimed when the test process exits.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
     import MLOXMaker.database.db as db_mod
-    new_engine = create_engine("sqlite:///:memory:", future=True)
-    # Dispose of the old engine and reassign to the new in-memory engine.
-    db_mod.engine.dispose()
-    db_mod.engine = new_engine
-    # Reconfigure SessionLocal to use the new engine.
-    SessionLocal.configure(bind=new_engine)
-    Base.metadata.create_all(bind=new_engine)
-    yield
-    Base.metadata.drop_all(bind=new_engine)
+    from MLOXMaker.database.manager import DatabaseManager  # Registers the models on Base.metadata
+    # StaticPool hands every checkout the same connection, so all fixtures and threads see one in-memory DB.
+    # Under pytest-xdist each worker names its own shared-cache DB, keeping workers fully isolated.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    new_engine = create_engine(
+        f"sqlite+pysqlite:///file:memdb_{worker_id}?mode=memory&cache=shared&uri=true",
+        future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    _enable_sqlite_savepoints(new_engine)
+    db_mod._engine = new_engine
+    # Drop any session factory bound to the old engine; get_session() rebuilds it on demand.
+    db_mod.SessionLocal = None
+    return new_engine
 
-# Define test_db fixture so that tests can get a fresh session.
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Initialize the database (schema creation) once per session, after the engine rebind.
+@pytest.fixture(scope="session")
+def _init_dbm(rebind_db_engine):
+    from MLOXMaker.database.manager import DatabaseManager
+    DatabaseManager.initialize()
 
 @pytest.fixture(scope="function")
-def test_db():
+def file_db(tmp_path, monkeypatch):
+    """
+    Points Settings.DATABASE_PATH at a fresh file and clears the engine, so the production
+    get_engine()/get_session() path builds a real pooled engine for this test only.
     """
-    Creates a new in-memory database for each test.
+    import MLOXMaker.database.db as db_mod
+    from MLOXMaker.config.settings import Settings
+    from MLOXMaker.database.manager import DatabaseManager
+    db_path = tmp_path / "mloxmaker.db"
+    monkeypatch.setattr(Settings, "DATABASE_PATH", db_path)
+    monkeypatch.setattr(db_mod, "_engine", None)
+    monkeypatch.setattr(db_mod, "SessionLocal", None)
+    DatabaseManager.invalidate_cache()
+    yield db_path
+    if db_mod._engine is not None:
+        db_mod._engine.dispose()
+    DatabaseManager.invalidate_cache()
+
+@pytest.fixture(scope="function")
+def test_db(rebind_db_engine, _init_dbm):
     """
-    engine = create_engine(TEST_DATABASE_URL, future=True)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    Base.metadata.create_all(bind=engine)
+    Runs each test inside an outer transaction that is rolled back on teardown.
+
+    The test's session and every DatabaseManager session share one connection. Their commits only
+    release SAVEPOINTs, so nothing a test writes outlives it.
+    """
+    from sqlalchemy.orm import sessionmaker
+    import MLOXMaker.database.db as db_mod
+    from MLOXMaker.database.manager import DatabaseManager
+    connection = rebind_db_engine.connect()
+    trans = connection.begin()
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=connection, join_transaction_mode="create_savepoint"
+    )
+    db_mod.SessionLocal = TestingSessionLocal
     session = TestingSessionLocal()
     yield session
     session.close()
-    Base.metadata.drop_all(bind=engine)
-
-# Clear the database between tests to ensure a clean state.
-@pytest.fixture(autouse=True)
-def clear_db():
-    from MLOXMaker.database.db import Base, engine
-    with engine.begin() as connection:
-        for table in reversed(Base.metadata.sorted_tables):
-            connection.execute(table.delete())
-    yield
-    with engine.begin() as connection:
-        for table in reversed(Base.metadata.sorted_tables):
-            connection.execute(table.delete())
-    DatabaseManager.initialize()
+    trans.rollback()
+    connection.close()
+    db_mod.SessionLocal = None
+    DatabaseManager.invalidate_cache()  # The read cache is DatabaseManager's only per-test state
@@ -1,39 +1,96 @@
+import os
+import subprocess
 import sys
-from contextlib import redirect_stdout
-from io import StringIO
+from pathlib import Path
 
+import pytest
+
+import MLOXMaker
 from MLOXMaker.cli import cli_main
 from MLOXMaker.database.manager import DatabaseManager
 
 
-def run_cli_command(command):
+def run_cli_command(command, capsys, monkeypatch):
     """Helper to mock CLI execution and capture output."""
-    sys.argv = ["mloxmaker"] + command.split()
-    output = StringIO()
-    with redirect_stdout(output):  # ✅ Ensure stdout is correctly redirected
-        cli_main()
-    return output.getvalue().strip()
+    monkeypatch.setattr(sys, "argv", ["mloxmaker"] + command.split())
+    capsys.readouterr()  # ✅ Only return output produced by this command
+    cli_main()
+    return capsys.readouterr().out.strip()
 
-def test_validate_empty_db():
+def test_validate_empty_db(test_db, capsys, monkeypatch):
     """Test validate command when no rules exist."""
-    output = run_cli_command("validate")
+    output = run_cli_command("validate", capsys, monkeypatch)
     assert "No rules found." in output
 
-def test_list_mods_empty_db():
+def test_list_mods_empty_db(test_db, capsys, monkeypatch):
     """Test list-mods command when no mods exist."""
-    output = run_cli_command("list-mods")
+    output = run_cli_command("list-mods", capsys, monkeypatch)
     assert "No mods found." in output
 
-def test_validate_with_rules():
+def test_validate_with_rules(test_db, capsys, monkeypatch):
     """Test validate command when rules exist."""
-    DatabaseManager.add_rule("Order", "TestMod.esp", "AnotherMod.esp", "High")
-    output = run_cli_command("validate")
-    assert "✅ 1 rules loaded." in output
+    DatabaseManager.add_rules([
+        {"rule_type": "Order", "mod_name": "TestMod.esp", "target_mod": "AnotherMod.esp", "severity": "High"},
+        {"rule_type": "Requires", "mod_name": "Patch.esp"},
+    ])
+    output = run_cli_command("validate", capsys, monkeypatch)
+    assert "✅ 2 rules loaded." in output
     assert "📌 Order: TestMod.esp -> AnotherMod.esp" in output
+    assert "📌 Requires: Patch.esp -> N/A" in output
 
-def test_list_mods_with_data():
+def test_list_mods_with_data(test_db, capsys, monkeypatch):
     """Test list-mods command when mods exist."""
-    DatabaseManager.add_mod("CoolMod.esp", "hash123", "Nexus")
-    output = run_cli_command("list-mods")
-    assert "📦 1 mods installed." in output
+    DatabaseManager.add_mods([
+        {"mod_name": "CoolMod.esp", "mod_hash": "hash123", "source": "Nexus"},
+        {"mod_name": "LocalMod.esp"},
+    ])
+    output = run_cli_command("list-mods", capsys, monkeypatch)
+    assert "📦 2 mods installed." in output
     assert "📜 CoolMod.esp (Source: Nexus)" in output
+    assert "📜 LocalMod.esp (Source: Unknown)" in output
+
+def test_no_command_prints_help(test_db, capsys, monkeypatch):
+    """Test that a missing command prints the help text."""
+    output = run_cli_command("", capsys, monkeypatch)
+    assert "usage: mloxmaker" in output
+    assert "list-mods" in output
+
+@pytest.mark.parametrize("command", ["frobnicate", "validat", "validate --bogus"])
+def test_unknown_command_prints_help(command, test_db, capsys, monkeypatch):
+    """Test that unknown commands and extra arguments print usage to stderr and exit with status 2."""
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli_command(command, capsys, monkeypatch)
+    assert exc_info.value.code == 2
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "usage: mloxmaker" in captured.err
+
+def test_help_does_not_build_engine(capsys, monkeypatch):
+    """Test that --help leaves the database engine unbuilt."""
+    import MLOXMaker.database.db as db_mod
+    monkeypatch.setattr(db_mod, "_engine", None)
+    monkeypatch.setattr(db_mod, "SessionLocal", None)
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli_command("--help", capsys, monkeypatch)
+    assert exc_info.value.code == 0
+    assert db_mod._engine is None
+    assert db_mod.SessionLocal is None
+
+def test_help_does_not_import_sqlalchemy():
+    """Test that a cold `--help` run never imports SQLAlchemy (checked in a fresh interpreter)."""
+    script = (
+        "import sys\n"
+        "sys.argv = ['mloxmaker', '--help']\n"
+        "from MLOXMaker.cli import cli_main\n"
+        "try:\n"
+        "    cli_main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'sqlalchemy' not in sys.modules, 'sqlalchemy was imported'\n"
+    )
+    src_dir = str(Path(MLOXMaker.__file__).resolve().parent.parent)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src_dir, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert "usage: mloxmaker" in result.stdout
@@ -1,3 +1,6 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
 from MLOXMaker.database.models import Rule, Mod, Dependency
 
 
@@ -7,9 +10,8 @@ def test_create_rule(test_db):
     test_db.add(rule)
     test_db.commit()
 
-    retrieved = test_db.query(Rule).filter_by(mod_name="A.esp").first()
-    assert retrieved is not None
-    assert retrieved.target_mod == "B.esp"
+    target_mod = test_db.query(Rule.target_mod).filter_by(mod_name="A.esp").scalar()
+    assert target_mod == "B.esp"
 
 def test_create_mod(test_db):
     """Test inserting a mod into the database."""
@@ -17,9 +19,8 @@ def test_create_mod(test_db):
     test_db.add(mod)
     test_db.commit()
 
-    retrieved = test_db.query(Mod).filter_by(mod_name="CoolMod.esp").first()
-    assert retrieved is not None
-    assert retrieved.mod_hash == "abc123"
+    mod_hash = test_db.query(Mod.mod_hash).filter_by(mod_name="CoolMod.esp").scalar()
+    assert mod_hash == "abc123"
 
 def test_create_dependency(test_db):
     """Test inserting a mod dependency."""
@@ -32,9 +33,8 @@ def test_create_dependency(test_db):
     test_db.add(dep)
     test_db.commit()
 
-    retrieved = test_db.query(Dependency).filter_by(mod_id=mod1.id).first()
-    assert retrieved is not None
-    assert retrieved.depends_on == mod2.id
+    depends_on = test_db.query(Dependency.depends_on).filter_by(mod_id=mod1.id).scalar()
+    assert depends_on == mod2.id
 
 def test_update_rule(test_db):
     """Test updating a rule."""
@@ -45,8 +45,8 @@ def test_update_rule(test_db):
     rule.severity = "Low"
     test_db.commit()
 
-    retrieved = test_db.query(Rule).filter_by(mod_name="X.esp").first()
-    assert retrieved.severity == "Low"
+    severity = test_db.query(Rule.severity).filter_by(mod_name="X.esp").scalar()
+    assert severity == "Low"
 
 def test_delete_mod(test_db):
     """Test deleting a mod."""
@@ -57,5 +57,36 @@ def test_delete_mod(test_db):
     test_db.delete(mod)
     test_db.commit()
 
-    retrieved = test_db.query(Mod).filter_by(mod_name="RemoveMe.esp").first()
-    assert retrieved is None
+    retrieved_id = test_db.query(Mod.id).filter_by(mod_name="RemoveMe.esp").scalar()
+    assert retrieved_id is None
+
+def test_duplicate_dependency_rejected(test_db):
+    """Test that the same mod dependency cannot be stored twice."""
+    mod1 = Mod(mod_name="Master.esp")
+    mod2 = Mod(mod_name="Addon.esp")
+    test_db.add_all([mod1, mod2])
+    test_db.commit()
+
+    test_db.add(Dependency(mod_id=mod1.id, depends_on=mod2.id))
+    test_db.commit()
+
+    test_db.add(Dependency(mod_id=mod1.id, depends_on=mod2.id))
+    with pytest.raises(IntegrityError):
+        test_db.commit()
+    test_db.rollback()
+
+def test_production_engine_applies_pragmas(file_db):
+    """Test that get_engine() builds a pooled engine whose connections carry the SQLite PRAGMAs."""
+    from sqlalchemy.pool import QueuePool
+    from MLOXMaker.database import db
+
+    engine = db.get_engine()
+    assert isinstance(engine.pool, QueuePool)
+    assert db.get_engine() is engine
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1       # NORMAL
+        assert connection.exec_driver_sql("PRAGMA temp_store").scalar() == 2        # MEMORY
+        assert connection.exec_driver_sql("PRAGMA cache_size").scalar() == -64000
+    assert file_db.exists()
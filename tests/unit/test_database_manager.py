@@ -7,22 +7,22 @@ def test_add_and_get_rule(test_db):
     """Test adding and retrieving a rule."""
     DatabaseManager.add_rule("Order", "TestMod.esp", "AnotherMod.esp", "High", "Test note")
 
-    rules = DatabaseManager.get_rules()
-    assert len(rules) == 1
-    assert rules[0].mod_name == "TestMod.esp"
-    assert rules[0].target_mod == "AnotherMod.esp"
-    assert rules[0].severity == "High"
+    assert DatabaseManager.count_rules() == 1
+    first = DatabaseManager.get_first_rule()
+    assert first.mod_name == "TestMod.esp"
+    assert first.target_mod == "AnotherMod.esp"
+    assert first.severity == "High"
 
 
 def test_add_and_get_mod(test_db):
     """Test adding and retrieving a mod."""
     DatabaseManager.add_mod("CoolMod.esp", "hash123", "Nexus")
 
-    mods = DatabaseManager.get_mods()
-    assert len(mods) == 1
-    assert mods[0].mod_name == "CoolMod.esp"
-    assert mods[0].mod_hash == "hash123"
-    assert mods[0].source == "Nexus"
+    assert DatabaseManager.count_mods() == 1
+    first = DatabaseManager.get_first_mod()
+    assert first.mod_name == "CoolMod.esp"
+    assert first.mod_hash == "hash123"
+    assert first.source == "Nexus"
 
 
 def test_add_and_get_dependency(test_db):
@@ -51,8 +51,8 @@ def test_update_rule(test_db):
     rule.severity = "Low"
     test_db.commit()
 
-    updated_rule = test_db.query(Rule).filter_by(mod_name="X.esp").first()
-    assert updated_rule.severity == "Low"
+    updated_severity = test_db.query(Rule.severity).filter_by(mod_name="X.esp").scalar()
+    assert updated_severity == "Low"
 
 
 def test_delete_mod(test_db):
@@ -65,5 +65,83 @@ def test_delete_mod(test_db):
     test_db.delete(mod)
     test_db.commit()
 
-    deleted_mod = test_db.query(Mod).filter_by(mod_name="RemoveMe.esp").first()
-    assert deleted_mod is None
+    deleted_mod_id = test_db.query(Mod.id).filter_by(mod_name="RemoveMe.esp").scalar()
+    assert deleted_mod_id is None
+
+
+def test_add_rules_bulk(test_db):
+    """Test adding several rules in one batch."""
+    DatabaseManager.add_rules([
+        {"rule_type": "Order", "mod_name": "A.esp", "target_mod": "B.esp"},
+        {"rule_type": "Conflict", "mod_name": "C.esp", "target_mod": "D.esp", "severity": "High"},
+    ])
+    DatabaseManager.add_rules([])
+
+    rules = DatabaseManager.get_rules()
+    assert [rule.mod_name for rule in rules] == ["A.esp", "C.esp"]
+    assert rules[1].severity == "High"
+
+
+def test_add_mods_and_dependencies_bulk(test_db):
+    """Test adding several mods and dependencies in one batch each."""
+    DatabaseManager.add_mods([{"mod_name": "Master.esp"}, {"mod_name": "Addon.esp", "source": "Nexus"}])
+
+    mods = {mod.mod_name: mod for mod in DatabaseManager.get_mods()}
+    assert mods["Addon.esp"].source == "Nexus"
+
+    DatabaseManager.add_dependencies([{"mod_id": mods["Addon.esp"].id, "depends_on": mods["Master.esp"].id}])
+
+    dependencies = DatabaseManager.get_dependencies()
+    assert len(dependencies) == 1
+    assert dependencies[0].depends_on == mods["Master.esp"].id
+
+
+def test_counts_and_first_on_empty_tables(test_db):
+    """Test scalar counts and first-row lookups when nothing is stored."""
+    assert DatabaseManager.count_rules() == 0
+    assert DatabaseManager.count_mods() == 0
+    assert DatabaseManager.get_first_rule() is None
+    assert DatabaseManager.get_first_mod() is None
+
+
+def test_get_rules_is_cached_until_write(test_db):
+    """Test that reads are served from cache and invalidated by writes."""
+    DatabaseManager.add_rule("Order", "A.esp", "B.esp")
+
+    first = DatabaseManager.get_rules()
+    assert DatabaseManager.get_rules() is first
+
+    DatabaseManager.add_rule("Order", "C.esp", "D.esp")
+    assert len(DatabaseManager.get_rules()) == 2
+
+
+def test_iter_rule_and_mod_summaries(test_db):
+    """Test the column-only summary reads used by the CLI."""
+    DatabaseManager.add_rule("Order", "A.esp", "B.esp", "High")
+    DatabaseManager.add_mod("CoolMod.esp", "hash123", "Nexus")
+
+    assert [tuple(row) for row in DatabaseManager.iter_rule_summaries()] == [("Order", "A.esp", "B.esp")]
+    assert [tuple(row) for row in DatabaseManager.iter_mod_summaries()] == [("CoolMod.esp", "Nexus")]
+
+def test_initialize_adds_indexes_to_existing_tables(file_db):
+    """Test that initialize() adds indexes missing from tables created by an older schema."""
+    import sqlite3
+    from sqlalchemy import inspect
+    from MLOXMaker.database import db
+
+    # An older database: the current tables, minus every index
+    DatabaseManager.initialize()
+    index_names = [index["name"] for table in ("rules", "dependencies", "predicates")
+                   for index in inspect(db.get_engine()).get_indexes(table)]
+    assert index_names
+    db.get_engine().dispose()
+    with sqlite3.connect(file_db) as connection:
+        for name in index_names:
+            connection.execute(f"DROP INDEX {name}")
+
+    DatabaseManager.initialize()
+
+    inspector = inspect(db.get_engine())
+    restored = {index["name"] for table in ("rules", "dependencies", "predicates")
+                for index in inspector.get_indexes(table)}
+    assert {"ix_rules_mod_name", "ix_rules_target_mod", "ix_predicates_rule_id", "ix_dep_mod_depends"} <= restored
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 from pathlib import Path
 from MLOXMaker.core.exceptions import (
@@ -7,129 +10,145 @@ from MLOXMaker.core.exceptions import (
     MissingFileError, ExistingFileError, FilePermissionError, ExportFailureError,
     CorruptRuleFileError
 )
-from MLOXMaker.managers.app_log import AppLog, LogGroup, LogEvent
+from MLOXMaker.managers.app_log import LogGroup, LogEvent
+
+# Expected paths, built once for every case that compares against them.
+P_FILE = Path("file.txt")
+P_MISSING = Path("missing.txt")
+P_EXISTING = Path("existing.txt")
+P_PROTECTED = Path("protected.txt")
+P_EXPORT = Path("export.txt")
+P_CORRUPT = Path("corrupt.txt")
 
-# Dummy logger that records log calls.
+# Dummy stand-in for AppLog: every logging method (warning, info, error, ...) records the call.
 class DummyLogger:
     def __init__(self):
         self.calls = []
+    def __getattr__(self, name):
+        return self.record
     def record(self, group, event, message, **kwargs):
         self.calls.append((group, event, message, kwargs))
     def reset(self):
         self.calls = []
 
-# A fixture that patches AppLog logging methods to our dummy record.
+# A fixture that swaps the exceptions module's AppLog for a fresh dummy (a single setattr to undo).
 @pytest.fixture(autouse=True)
 def dummy_logger(monkeypatch):
     dummy = DummyLogger()
-    monkeypatch.setattr(AppLog, "warning", dummy.record)
-    monkeypatch.setattr(AppLog, "info", dummy.record)
-    monkeypatch.setattr(AppLog, "error", dummy.record)
+    monkeypatch.setattr("MLOXMaker.core.exceptions.AppLog", dummy)
     return dummy
 
 # Helper function to assert that the log call matches our expectations.
-def assert_log(dummy, exc_instance, expected_details):
+def assert_log(dummy, expected_message, expected_details):
     # log_error() is called during __init__, so we expect one log call.
     assert len(dummy.calls) == 1, f"Expected 1 log call, got {len(dummy.calls)}"
     group, event, message, kwargs = dummy.calls[0]
     # Expected group and event.
     assert group == LogGroup.SYSTEM
     assert event == LogEvent.FAILED
-    # Expected message: "<ExceptionClass>: <exception message>"
-    expected_full_message = f"{exc_instance.__class__.__name__}: {exc_instance}"
-    assert message == expected_full_message
+    # Expected message: the literal "<ExceptionClass>: <exception message>" line
+    assert message == expected_message
     # The "terse" keyword should be set to the provided details.
     assert kwargs.get("terse") == expected_details
     dummy.reset()
 
-def test_mlox_error(dummy_logger):
+# (exception class, positional args, keyword args, expected log line, expected terse details)
+CASES = [
+    pytest.param(MLOXError, ("test message",), {"level": ErrorLevel.CRITICAL, "details": "detail"},
+                 "MLOXError: test message", "detail", id="MLOXError"),
+    pytest.param(MLOXRuleError, ("rule error",), {"level": ErrorLevel.CRITICAL, "details": "rule detail"},
+                 "MLOXRuleError: rule error", "rule detail", id="MLOXRuleError"),
+    pytest.param(InvalidRuleSyntaxError, ("foo",), {},
+                 "InvalidRuleSyntaxError: Invalid rule syntax: foo", "Check rule formatting for errors.",
+                 id="InvalidRuleSyntaxError"),
+    pytest.param(MissingModError, ("mod1",), {},
+                 "MissingModError: Mod not found: mod1", "Ensure the mod is installed or correctly referenced.",
+                 id="MissingModError"),
+    pytest.param(CircularDependencyError, ("mod2",), {},
+                 "CircularDependencyError: Circular dependency detected for: mod2",
+                 "A mod depends on itself, directly or indirectly.", id="CircularDependencyError"),
+    pytest.param(ConflictingRuleError, ("ruleA", "ruleB"), {},
+                 "ConflictingRuleError: Conflicting rules detected: ruleA <-> ruleB",
+                 "Check rule definitions for logical contradictions.", id="ConflictingRuleError"),
+    pytest.param(MLOXAPIError, ("api error",), {"level": ErrorLevel.CRITICAL, "details": "api detail"},
+                 "MLOXAPIError: api error", "api detail", id="MLOXAPIError"),
+    pytest.param(NexusAPIFetchError, ("query",), {},
+                 "NexusAPIFetchError: Failed to fetch data for: query", "Check API status or network connection.",
+                 id="NexusAPIFetchError"),
+    pytest.param(NexusRateLimitError, (), {},
+                 "NexusRateLimitError: Nexus API rate limit exceeded.", "Try again later or reduce request frequency.",
+                 id="NexusRateLimitError"),
+    pytest.param(InvalidAPICredentials, (), {},
+                 "InvalidAPICredentials: Invalid or missing Nexus API key.",
+                 "Ensure your API key is correctly configured.", id="InvalidAPICredentials"),
+    pytest.param(ModMetadataParseError, ("mod3",), {},
+                 "ModMetadataParseError: Failed to parse metadata for mod: mod3",
+                 "API response may be malformed or incomplete.", id="ModMetadataParseError"),
+    pytest.param(MLOXIOError, ("file.txt", "custom error", ErrorLevel.WARNING, "io detail"), {},
+                 "MLOXIOError: custom error: file.txt", "io detail", id="MLOXIOError"),
+    pytest.param(MLOXIOError, (P_FILE, "custom error", ErrorLevel.WARNING, "io detail"), {},
+                 "MLOXIOError: custom error: file.txt", "io detail", id="MLOXIOError-path"),
+    pytest.param(MissingFileError, ("missing.txt",), {},
+                 "MissingFileError: File not found: missing.txt", "Ensure the file exists and is accessible.",
+                 id="MissingFileError"),
+    pytest.param(ExistingFileError, ("existing.txt",), {},
+                 "ExistingFileError: File already exists: existing.txt",
+                 "Consider renaming or removing the existing file.", id="ExistingFileError"),
+    pytest.param(FilePermissionError, ("protected.txt",), {},
+                 "FilePermissionError: Insufficient permissions for file: protected.txt",
+                 "Check file permissions and try again.", id="FilePermissionError"),
+    pytest.param(ExportFailureError, ("export.txt",), {},
+                 "ExportFailureError: Failed to export rules: export.txt",
+                 "Ensure the file is writable and disk space is sufficient.", id="ExportFailureError"),
+    pytest.param(CorruptRuleFileError, ("corrupt.txt",), {},
+                 "CorruptRuleFileError: Corrupt rule file detected: corrupt.txt",
+                 "File may be incomplete or incorrectly formatted.", id="CorruptRuleFileError"),
+]
+
+@pytest.mark.parametrize("cls,args,kwargs,expected_message,expected_details", CASES)
+def test_exception_logs(cls, args, kwargs, expected_message, expected_details, dummy_logger):
+    cls(*args, **kwargs)
+    assert_log(dummy_logger, expected_message, expected_details)
+
+def test_mlox_error_attributes(dummy_logger):
     e = MLOXError("test message", level=ErrorLevel.CRITICAL, details="detail")
-    assert_log(dummy_logger, e, "detail")
     assert e.level == ErrorLevel.CRITICAL
     assert e.details == "detail"
 
-def test_mlox_rule_error(dummy_logger):
-    e = MLOXRuleError("rule error", level=ErrorLevel.CRITICAL, details="rule detail")
-    assert_log(dummy_logger, e, "rule detail")
-
-def test_invalid_rule_syntax_error(dummy_logger):
-    e = InvalidRuleSyntaxError("foo")
-    assert_log(dummy_logger, e, "Check rule formatting for errors.")
-
-def test_missing_mod_error(dummy_logger):
-    e = MissingModError("mod1")
-    assert_log(dummy_logger, e, "Ensure the mod is installed or correctly referenced.")
-
-def test_circular_dependency_error(dummy_logger):
-    e = CircularDependencyError("mod2")
-    assert_log(dummy_logger, e, "A mod depends on itself, directly or indirectly.")
-
-def test_conflicting_rule_error(dummy_logger):
-    e = ConflictingRuleError("ruleA", "ruleB")
-    assert_log(dummy_logger, e, "Check rule definitions for logical contradictions.")
-
-def test_mlox_api_error(dummy_logger):
-    e = MLOXAPIError("api error", level=ErrorLevel.CRITICAL, details="api detail")
-    assert_log(dummy_logger, e, "api detail")
-
-def test_nexus_api_fetch_error(dummy_logger):
-    e = NexusAPIFetchError("query")
-    assert_log(dummy_logger, e, "Check API status or network connection.")
-
-def test_nexus_rate_limit_error(dummy_logger):
-    e = NexusRateLimitError()
-    assert_log(dummy_logger, e, "Try again later or reduce request frequency.")
-
-def test_invalid_api_credentials(dummy_logger):
-    e = InvalidAPICredentials()
-    assert_log(dummy_logger, e, "Ensure your API key is correctly configured.")
-
-def test_mod_metadata_parse_error(dummy_logger):
-    e = ModMetadataParseError("mod3")
-    assert_log(dummy_logger, e, "API response may be malformed or incomplete.")
-
-def test_mlox_io_error(dummy_logger):
-    e = MLOXIOError("file.txt", "custom error", ErrorLevel.WARNING, "io detail")
-    expected_message = f"MLOXIOError: custom error: {Path('file.txt')}"
-    # The log message is generated from the exception’s __str__ (which is "custom error: file.txt")
-    assert_log(dummy_logger, e, "io detail")
+# IO errors always store a pathlib.Path, whether given a str or a Path.
+@pytest.mark.parametrize("cls,args,expected_path", [
+    (MLOXIOError, ("file.txt", "custom error", ErrorLevel.WARNING, "io detail"), P_FILE),
+    (MLOXIOError, (P_FILE, "custom error", ErrorLevel.WARNING, "io detail"), P_FILE),
+    (MissingFileError, ("missing.txt",), P_MISSING),
+    (ExistingFileError, ("existing.txt",), P_EXISTING),
+    (FilePermissionError, ("protected.txt",), P_PROTECTED),
+    (ExportFailureError, ("export.txt",), P_EXPORT),
+    (CorruptRuleFileError, ("corrupt.txt",), P_CORRUPT),
+])
+def test_io_error_file_path(cls, args, expected_path, dummy_logger):
+    e = cls(*args)
     assert isinstance(e.file_path, Path)
-    assert e.file_path == Path("file.txt")
-
-def test_mlox_io_error_with_path(dummy_logger):
-    """Ensure MLOXIOError correctly handles Path objects."""
-    e = MLOXIOError(Path("file.txt"), "custom error", ErrorLevel.WARNING, "io detail")
-    assert isinstance(e.file_path, Path)
-    assert e.file_path == Path("file.txt")
-    assert_log(dummy_logger, e, "io detail")
-
-
-def test_missing_file_error(dummy_logger):
-    e = MissingFileError("missing.txt")
-    expected_message = f"MissingFileError: File not found: {Path('missing.txt')}"
-    assert_log(dummy_logger, e, "Ensure the file exists and is accessible.")
-    assert e.file_path == Path("missing.txt")
-
-def test_existing_file_error(dummy_logger):
-    e = ExistingFileError("existing.txt")
-    expected_message = f"ExistingFileError: File already exists: {Path('existing.txt')}"
-    assert_log(dummy_logger, e, "Consider renaming or removing the existing file.")
-    assert e.file_path == Path("existing.txt")
-
-def test_file_permission_error(dummy_logger):
-    e = FilePermissionError("protected.txt")
-    expected_message = f"FilePermissionError: Insufficient permissions for file: {Path('protected.txt')}"
-    assert_log(dummy_logger, e, "Check file permissions and try again.")
-    assert e.file_path == Path("protected.txt")
-
-def test_export_failure_error(dummy_logger):
-    e = ExportFailureError("export.txt")
-    expected_message = f"ExportFailureError: Failed to export rules: {Path('export.txt')}"
-    assert_log(dummy_logger, e, "Ensure the file is writable and disk space is sufficient.")
-    assert e.file_path == Path("export.txt")
-
-def test_corrupt_rule_file_error(dummy_logger):
-    e = CorruptRuleFileError("corrupt.txt")
-    expected_message = f"CorruptRuleFileError: Corrupt rule file detected: {Path('corrupt.txt')}"
-    assert_log(dummy_logger, e, "File may be incomplete or incorrectly formatted.")
-    assert e.file_path == Path("corrupt.txt")
+    assert e.file_path == expected_path
+
+
+# Slot values (level, details, file_path) must survive pickling and copying, without logging again.
+@pytest.mark.parametrize("clone", [
+    pytest.param(lambda e: pickle.loads(pickle.dumps(e)), id="pickle"),
+    pytest.param(copy.copy, id="copy"),
+    pytest.param(copy.deepcopy, id="deepcopy"),
+])
+@pytest.mark.parametrize("original", [
+    pytest.param(lambda: MLOXError("m", level=ErrorLevel.WARNING, details="d"), id="MLOXError"),
+    pytest.param(lambda: MLOXIOError("file.txt", "custom error", ErrorLevel.WARNING, "io detail"), id="MLOXIOError"),
+    pytest.param(lambda: MissingFileError("missing.txt"), id="MissingFileError"),
+])
+def test_exception_round_trip(clone, original, dummy_logger):
+    e = original()
+    dummy_logger.reset()
+    restored = clone(e)
+    assert type(restored) is type(e)
+    assert restored.args == e.args
+    assert restored.level == e.level
+    assert restored.details == e.details
+    assert getattr(restored, "file_path", None) == getattr(e, "file_path", None)
+    assert dummy_logger.calls == []
@@ -1,37 +1,58 @@
 import logging
+import sys
 
 import pytest
 
 from MLOXMaker.config.settings import Settings
-from MLOXMaker.managers.app_log import AppLogFormatter, AppLog, LogGroup, LogEvent
+from MLOXMaker.managers.app_log import AppLogFormatter, AppLog, LogConfig, LogGroup, LogEvent
 
 
 @pytest.fixture(autouse=True)
 def override_settings(monkeypatch):
     monkeypatch.setattr(Settings, "LOGGER_NAME", "APP_LOGGER")
     monkeypatch.setattr(Settings, "LOG_LEVEL", "DEBUG")
+    LogConfig.from_settings.cache_clear()
+    yield
+    LogConfig.from_settings.cache_clear()
+
+@pytest.fixture(scope="module")
+def app_logger():
+    """The "APP_LOGGER" logger, looked up once for the whole module."""
+    return logging.getLogger("APP_LOGGER")
+
+@pytest.fixture(scope="module")
+def formatter():
+    """A single `AppLogFormatter`, shared by every formatter test in the module."""
+    return AppLogFormatter(datefmt="%Y-%m-%d %H:%M:%S")
+
+# Built once at import; create_test_record() only rewrites the fields a test cares about.
+_TEMPLATE_RECORD = logging.LogRecord(
+    name="APP_LOGGER",
+    level=logging.INFO,
+    pathname=__file__,
+    lineno=10,
+    msg="",
+    args=(),
+    exc_info=None
+)
 
 def create_test_record(message, level=logging.INFO, tag="UNIT", event="COMPLETED"):
     """
-    🏗️ Creates a test log record for validation.
+    🏗️ Prepares the shared test log record for validation.
 
     🔹 Simulates an actual log entry with a custom message, log level, tag, and event.
     """
-    record = logging.LogRecord(
-        name="APP_LOGGER",
-        level=level,
-        pathname=__file__,
-        lineno=10,
-        msg=message,
-        args=(),
-        exc_info=None
-    )
+    record = _TEMPLATE_RECORD
+    record.msg = message
+    record.levelno = level
+    record.levelname = logging.getLevelName(level)
     record.tag = tag
     record.event = event
+    record.__dict__.pop("group", None)  # Left behind by a previous format() or test
     return record
 
 
-def test_log_formatter():
+def test_log_formatter(formatter):
     """
     🎨 Tests the custom AppLogFormatter.
 
@@ -44,7 +65,6 @@ def test_log_formatter():
        - The `[COMPLETED]` event.
        - The original message.
     """
-    formatter = AppLogFormatter(datefmt="%Y-%m-%d %H:%M:%S")
     record = create_test_record("This is a test message")
     formatted = formatter.format(record)
 
@@ -54,7 +74,21 @@ def test_log_formatter():
     assert "This is a test message" in formatted  # Message content
 
 
-def test_set_log_level():
+def test_log_formatter_precomputed_tags(formatter):
+    """
+    🏷️ Tests that precomputed level/group/event tags match on-the-fly formatting.
+
+    🔹 Known enum values come from the lookup tables; unknown values still get padded and upper-cased.
+    """
+    record = create_test_record("Tagged message")
+    record.group = LogGroup.SYSTEM
+    record.event = "custom"
+    formatted = formatter.format(record)
+
+    assert "[INFO   ] [SYSTEM  ] [CUSTOM   ]" in formatted
+
+
+def test_set_log_level(app_logger):
     """
     📡 Tests AppLog.set_log_level().
 
@@ -63,10 +97,42 @@ def test_set_log_level():
     2️⃣ Sets the log level to `DEBUG` and verifies the change.
     """
     AppLog.set_log_level("ERROR")
-    assert logging.getLogger("APP_LOGGER").level == logging.ERROR
+    assert app_logger.level == logging.ERROR
 
     AppLog.set_log_level("DEBUG")
-    assert logging.getLogger("APP_LOGGER").level == logging.DEBUG
+    assert app_logger.level == logging.DEBUG
+
+
+@pytest.mark.parametrize("alias,expected", [
+    ("warn", logging.WARNING),
+    ("FATAL", logging.CRITICAL),
+    ("NOTSET", logging.NOTSET),
+])
+def test_set_log_level_accepts_stdlib_aliases(alias, expected, app_logger):
+    """
+    🏷️ Tests that the stdlib level aliases map to their real levels instead of falling back to DEBUG.
+    """
+    AppLog.set_log_level(alias)
+    assert app_logger.level == expected
+    AppLog.set_log_level("DEBUG")
+
+
+def test_filtered_level_skips_logging(capsys):
+    """
+    🔇 Tests that messages below the logger level are dropped before any output is produced.
+    """
+    AppLog.toggle_console_logging(True, AppLog.get_logger())
+    AppLog.set_log_level("WARNING")
+    capsys.readouterr()
+
+    AppLog.debug(group=LogGroup.SYSTEM, event=LogEvent.COMPLETED, report="Hidden debug")
+    AppLog.warning(group=LogGroup.SYSTEM, event=LogEvent.COMPLETED, report="Visible warning")
+    AppLog.set_log_level("DEBUG")
+
+    captured = capsys.readouterr()
+    output = captured.out + captured.err
+    assert "Hidden debug" not in output
+    assert "Visible warning" in output
 
 
 def test_toggle_stdout_logging(capsys):
@@ -77,7 +143,9 @@ def test_toggle_stdout_logging(capsys):
     1️⃣ Disable console logging and verify no output is captured.
     2️⃣ Enable console logging and verify expected output appears.
     """
-    AppLog.toggle_console_logging(False)
+    logger = AppLog.get_logger()  # Initialize first so setup can't re-enable the console mid-test
+    AppLog.toggle_console_logging(False, logger)
+    capsys.readouterr()  # Discard any setup output
     AppLog.info(
         group=LogGroup.SYSTEM,
         event=LogEvent.COMPLETED,
@@ -89,7 +157,7 @@ def test_toggle_stdout_logging(capsys):
     output = captured.out[1:] if captured.out.startswith("\n") else captured.out
     assert (output + captured.err) == ""  # Should capture nothing
 
-    AppLog.toggle_console_logging(True)
+    AppLog.toggle_console_logging(True, logger)
     AppLog.info(
         group=LogGroup.SYSTEM,
         event=LogEvent.COMPLETED,
@@ -101,26 +169,25 @@ def test_toggle_stdout_logging(capsys):
     assert "Test console logging enabled" in (captured.out + captured.err)
 
 
-def test_enable_file_logging(tmp_path):
+def test_enable_file_logging(shared_log_file):
     """
     📂 Tests file logging.
 
     🔹 Steps:
-    1️⃣ Create a custom logger configuration with a temporary file.
+    1️⃣ Truncate the session's shared log file and point a custom logger configuration at it.
     2️⃣ Reinitialize `AppLog` with the new config.
-    3️⃣ Write a test log message and flush handlers.
-    4️⃣ Verify that the log file contains the expected entry.
-    5️⃣ Clean up by disabling file logging.
+    3️⃣ Write a test log message.
+    4️⃣ Disable file logging, which flushes the queued records to disk.
+    5️⃣ Verify that the log file contains the expected entries.
     """
-    from MLOXMaker.managers.app_log import LogConfig
-
-    # Set up logging with a temporary test file
+    # Set up logging with the shared (freshly truncated) test file
+    shared_log_file.write_text("", encoding="utf-8")
     custom_config = LogConfig(
         logger_name="APP_LOGGER",
         log_level="DEBUG",
         toggle_console_logging=True,
         toggle_file_logging=True,
-        log_file_path=tmp_path / "test_app.log"
+        log_file_path=shared_log_file
     )
 
     AppLog._initialized = False  # Reset logger
@@ -135,17 +202,70 @@ def test_enable_file_logging(tmp_path):
 
     log_file = custom_config.log_file_path
 
-    # Ensure data is written before reading
-    for handler in logging.getLogger("APP_LOGGER").handlers:
-        if isinstance(handler, logging.FileHandler):
-            handler.flush()
+    # Disabling file logging stops the background listener, draining queued records to disk
+    AppLog.toggle_file_logging(False)
 
     with open(log_file, "r", encoding="utf-8") as f:
         content = f.read()
 
     assert "File logging enabled at" in content  # Ensure logging was written
+    assert "Test file logging" in content
 
-    AppLog.toggle_file_logging(False)  # Clean up
+def test_headless_logging_is_noop(capsys):
+    """
+    🔕 Tests that with console and file logging both disabled, AppLog calls produce nothing.
+
+    🔹 Steps:
+    1️⃣ Reinitialize `AppLog` with no console or file output.
+    2️⃣ Verify only a `NullHandler` is attached and the fast path is active.
+    3️⃣ Log a message and ensure nothing reaches stdout/stderr.
+    """
+    headless_config = LogConfig(
+        logger_name="APP_LOGGER",
+        log_level="DEBUG",
+        toggle_console_logging=False,
+        toggle_file_logging=False,
+    )
+
+    AppLog._initialized = False
+    AppLog.setup_logger(config=headless_config)
+    capsys.readouterr()
+
+    assert AppLog.logger.handlers == [AppLog._null_handler]
+
+    AppLog.error(group=LogGroup.SYSTEM, event=LogEvent.FAILED, report="Should not appear")
+    captured = capsys.readouterr()
+    assert "Should not appear" not in (captured.out + captured.err)
+
+    AppLog._initialized = False  # Let the next test rebuild the default configuration
+
+@pytest.mark.parametrize("swap_out_null_handler", [False, True], ids=["added", "swapped"])
+def test_headless_logging_picks_up_external_handler(swap_out_null_handler, capsys):
+    """
+    🔌 Tests that a handler attached directly to the logger (e.g. by an embedding host) re-enables output,
+    whether it is added next to the `NullHandler` or replaces it in place.
+    """
+    headless_config = LogConfig(
+        logger_name="APP_LOGGER",
+        log_level="DEBUG",
+        toggle_console_logging=False,
+        toggle_file_logging=False,
+    )
+
+    AppLog._initialized = False
+    AppLog.setup_logger(config=headless_config)
+
+    if swap_out_null_handler:
+        AppLog.logger.removeHandler(AppLog._null_handler)
+    host_handler = logging.StreamHandler(sys.stdout)
+    AppLog.logger.addHandler(host_handler)
+    capsys.readouterr()
+
+    AppLog.error(group=LogGroup.SYSTEM, event=LogEvent.FAILED, report="Host sees this")
+    assert "Host sees this" in capsys.readouterr().out
+
+    AppLog.logger.removeHandler(host_handler)
+    AppLog._initialized = False  # Let the next test rebuild the default configuration
 
 def test_all_log_levels(capsys, monkeypatch):
     """
@@ -191,7 +311,19 @@ def test_all_log_levels(capsys, monkeypatch):
     assert "Test error" in output and "Error test" in output
     assert "Test critical" in output and "Critical test" in output
 
-def test_setup_logger_already_initialized():
+def test_log_config_from_settings_is_cached():
+    """
+    🗃️ Tests that `LogConfig.from_settings()` is memoized until its cache is cleared.
+    """
+    config = LogConfig.from_settings()
+    assert LogConfig.from_settings() is config
+    assert config.logger_name == "APP_LOGGER"
+
+    LogConfig.from_settings.cache_clear()
+    assert LogConfig.from_settings() is not config
+
+
+def test_setup_logger_already_initialized(app_logger):
     """
     🚀 Tests that `setup_logger()` returns immediately when already initialized.
 
@@ -203,7 +335,7 @@ def test_setup_logger_already_initialized():
     """
     # Simulate an already initialized logger
     AppLog._initialized = True
-    original_logger = logging.getLogger("APP_LOGGER")
+    original_logger = app_logger
     AppLog.logger = original_logger
 
     # Call setup_logger (should do nothing)
@@ -235,7 +367,7 @@ def test_get_logger_invokes_setup():
 
 
 
-def test_remove_handlers():
+def test_remove_handlers(app_logger):
     """
     🧹 Tests that `_remove_handlers()` properly removes handlers of a specific type.
 
@@ -244,17 +376,17 @@ def test_remove_handlers():
     2️⃣ Call `_remove_handlers()` targeting `StreamHandler`.
     3️⃣ Ensure the handler is **removed**.
     """
-    logger = logging.getLogger("APP_LOGGER")
+    logger = app_logger
 
     # Add a test handler
     test_handler = logging.StreamHandler()
     logger.addHandler(test_handler)
 
     # Verify handler was added
-    assert any(isinstance(h, logging.StreamHandler) for h in logger.handlers), "Handler should exist before removal"
+    assert any(type(h) is logging.StreamHandler for h in logger.handlers), "Handler should exist before removal"
 
     # Call remove method
     AppLog._remove_handlers(logger, logging.StreamHandler)
 
     # Verify handler was removed
-    assert not any(isinstance(h, logging.StreamHandler) for h in logger.handlers), "Handler should be removed"
+    assert not any(type(h) is logging.StreamHandler for h in logger.handlers), "Handler should be removed"